@@ -28,11 +28,13 @@ def longest_streak(habit):
     if not habit.completion_dates:
         return 0
 
-    completion_dates = sorted([datetime.strptime(date, "%Y-%m-%d") for date in habit.completion_dates])
+    completion_dates = [datetime.strptime(date, "%Y-%m-%d") for date in habit.completion_dates]
     streak = 1
     streak_longest = 1
     for i in range(1, len(completion_dates)):
         delta = completion_dates[i] - completion_dates[i - 1]
+        if delta <= timedelta(0):
+            continue
         if habit.periodicity == "daily" and delta <= timedelta(days=1):
             streak += 1
         elif habit.periodicity == "weekly" and delta <= timedelta(weeks=1):
@@ -70,8 +70,11 @@ def main():
         elif choice == "4":
             habit_id = int(input("Enter habit ID: "))
             completion_date = input("Enter completion date (YYYY-MM-DD): ")
-            complete_task(habit_id, completion_date)
-            print(f"Task completed for habit with ID {habit_id} on {completion_date}")
+            if complete_task(habit_id, completion_date):
+                print(f"Task completed for habit with ID {habit_id} on {completion_date}")
+            else:
+                print(f"Task for habit with ID {habit_id} on {completion_date} not recorded "
+                      f"(invalid or already completed).")
         elif choice == "5":
             periodicity = input("Enter periodicity (daily or weekly): ")
             habits = get_habits_by_periodicity(get_habits(), periodicity)
@@ -1,3 +1,4 @@
+from bisect import bisect_left, bisect_right, insort
 from datetime import timedelta, datetime
 
 
@@ -11,7 +12,7 @@ class Habit:
         task (str): Task associated with the habit.
         periodicity (str): Frequency with which the task should be completed.
         creation_date (str): Date the habit was created.
-        completion_dates (list): List of dates on which the habit task was completed.
+        completion_dates (list): Sorted list of unique dates on which the habit task was completed.
     """
 
     def __init__(self, id, name="", task="", periodicity="", creation_date="", completion_dates=None):
@@ -43,9 +44,62 @@ class Habit:
             completion_date (str): The date on which the task was completed.
 
         Returns:
-            bool: True if the task was successfully marked as complete, False otherwise.
+            bool: True if the task was successfully marked as complete, False if the date is invalid
+            or the task was already completed on that date.
         """
-        self.completion_dates.append(completion_date)
+        completion_date = self.normalize_date(completion_date)
+        if completion_date is None or self.is_completed_on(completion_date):
+            return False
+        insort(self.completion_dates, completion_date)
+        return True
+
+    def is_completed_on(self, date):
+        """
+        Checks whether the task was completed on a given date.
+
+        Args:
+            date (str): The date to check.
+
+        Returns:
+            bool: True if the task was completed on the given date, False otherwise.
+        """
+        date = self.normalize_date(date)
+        if date is None:
+            return False
+        index = bisect_left(self.completion_dates, date)
+        return index < len(self.completion_dates) and self.completion_dates[index] == date
+
+    def next_completion(self, date):
+        """
+        Finds the first completion date strictly after a given date.
+
+        Args:
+            date (str): The date to search from.
+
+        Returns:
+            str: The next completion date, or None if there is none.
+        """
+        date = self.normalize_date(date)
+        if date is None:
+            return None
+        index = bisect_right(self.completion_dates, date)
+        return self.completion_dates[index] if index < len(self.completion_dates) else None
+
+    def previous_completion(self, date):
+        """
+        Finds the last completion date strictly before a given date.
+
+        Args:
+            date (str): The date to search from.
+
+        Returns:
+            str: The previous completion date, or None if there is none.
+        """
+        date = self.normalize_date(date)
+        if date is None:
+            return None
+        index = bisect_left(self.completion_dates, date)
+        return self.completion_dates[index - 1] if index > 0 else None
 
     @property
     def streaks(self):
@@ -61,7 +115,7 @@ class Habit:
         streaks_count = 0
         period = timedelta(days=1 if self.periodicity == "daily" else 7)
 
-        sorted_dates = sorted(datetime.strptime(date_str, "%Y-%m-%d") for date_str in self.completion_dates)
+        sorted_dates = [datetime.strptime(date_str, "%Y-%m-%d") for date_str in self.completion_dates]
         streaks = []
         current_streak = [sorted_dates[0]]
 
@@ -80,6 +134,22 @@ class Habit:
 
         return streaks_count
 
+    @staticmethod
+    def normalize_date(date_str):
+        """
+        Normalizes a date string to the YYYY-MM-DD format so that string order matches date order.
+
+        Args:
+            date_str (str): The date to normalize.
+
+        Returns:
+            str: The normalized date, or None if the date is invalid.
+        """
+        try:
+            return datetime.strptime(date_str, "%Y-%m-%d").strftime("%Y-%m-%d")
+        except (TypeError, ValueError):
+            return None
+
     def validate_completion_dates(self, completion_dates):
         """
         Validates the list of completion dates.
@@ -88,19 +158,19 @@ class Habit:
             completion_dates (list): List of dates to validate.
 
         Returns:
-            list: List of validated completion dates.
+            list: Sorted list of unique validated completion dates.
         """
         if completion_dates is None:
             return []
 
-        valid_dates = []
+        valid_dates = set()
         for date_str in completion_dates:
-            try:
-                date = datetime.strptime(date_str, "%Y-%m-%d").date()
-                valid_dates.append(date_str)
-            except ValueError:
+            date = self.normalize_date(date_str)
+            if date is None:
                 print(f"Invalid date format found: {date_str}, skipping this date.")
-        return valid_dates
+            else:
+                valid_dates.add(date)
+        return sorted(valid_dates)
 
     def __str__(self):
         """
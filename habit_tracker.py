@@ -32,7 +32,7 @@ def get_habit_by_id(habit_id):
 
     if habit_row:
         id, name, task, periodicity, creation_date = habit_row
-        c.execute("SELECT completion_date FROM completions WHERE habit_id = ?", (id,))
+        c.execute("SELECT completion_date FROM completions WHERE habit_id = ? ORDER BY completion_date", (id,))
         completion_dates = [row[0] for row in c.fetchall()]
         conn.close()
         return Habit(id, name, task, periodicity, creation_date, completion_dates)
@@ -84,7 +84,7 @@ def update_habit(habit_id, name, task, periodicity):
 
 def delete_habit(habit_id):
     """
-    Deletes a habit based on its ID.
+    Deletes a habit and its completion records based on its ID.
 
     Args:
         habit_id (int): The ID of the habit to be deleted.
@@ -94,6 +94,7 @@ def delete_habit(habit_id):
     """
     conn = create_connection()
     c = conn.cursor()
+    c.execute("DELETE FROM completions WHERE habit_id = ?", (habit_id,))
     c.execute("DELETE FROM habits WHERE id = ?", (habit_id,))
     conn.commit()
     conn.close()
@@ -120,16 +121,26 @@ def complete_task(habit_id, completion_date):
     Args:
         habit_id (int): The ID of the habit whose task was completed.
         completion_date (str): The date on which the task was completed.
+
+    Returns:
+        bool: True if the completion was recorded, False if the habit does not exist, the date is invalid
+        or the task was already completed on that date.
     """
-    habit = get_habit_by_id(habit_id)
-    if habit:
-        # habit.complete_task(completion_date)
-        # habit.completion_dates.sort()
-        conn = create_connection()
-        c = conn.cursor()
-        c.execute("INSERT INTO completions (habit_id, completion_date) VALUES (?, ?)", (habit_id, completion_date))
+    completion_date = Habit.normalize_date(completion_date)
+    if completion_date is None:
+        return False
+
+    conn = create_connection()
+    c = conn.cursor()
+    c.execute("SELECT 1 FROM habits WHERE id = ?", (habit_id,))
+    recorded = False
+    if c.fetchone():
+        c.execute("INSERT OR IGNORE INTO completions (habit_id, completion_date) VALUES (?, ?)",
+                  (habit_id, completion_date))
+        recorded = c.rowcount == 1
         conn.commit()
-        conn.close()
+    conn.close()
+    return recorded
 
 
 def get_habits():
@@ -146,7 +157,7 @@ def get_habits():
 
     habits = []
     for id, name, task, periodicity, creation_date in habit_rows:
-        c.execute("SELECT completion_date FROM completions WHERE habit_id = ?", (id,))
+        c.execute("SELECT completion_date FROM completions WHERE habit_id = ? ORDER BY completion_date", (id,))
         completion_dates = [row[0] for row in c.fetchall()]
         habit = Habit(id, name, task, periodicity, creation_date, completion_dates)
         habits.append(habit)
@@ -187,7 +198,8 @@ def get_completions_for_habit(habit_id):
     """
     conn = create_connection()
     c = conn.cursor()
-    c.execute("SELECT id, completion_date FROM completions WHERE habit_id = ?", (habit_id,))
+    c.execute("SELECT id, completion_date FROM completions WHERE habit_id = ? ORDER BY completion_date",
+              (habit_id,))
     completion_rows = c.fetchall()
     conn.close()
 
@@ -1,5 +1,6 @@
 import sqlite3
 
+from habit import Habit
 from habit_tracker import create_habit, delete_habit, delete_completion, complete_task, get_habits, get_completions
 from datetime import datetime, timedelta
 
@@ -24,9 +25,41 @@ def create_tables(conn):
                         habit_id INTEGER, 
                         completion_date TEXT,
                         FOREIGN KEY (habit_id) REFERENCES habits (id))''')
+
+    normalize_completions(c)
+    c.execute('''CREATE UNIQUE INDEX IF NOT EXISTS idx_completions_habit_date
+                    ON completions (habit_id, completion_date)''')
     conn.commit()
 
 
+def normalize_completions(c):
+    """
+    Rewrites completion dates to the YYYY-MM-DD format and removes duplicate completions.
+
+    Databases created before the unique constraint may hold duplicate or unpadded dates.
+    Invalid dates are kept as they are.
+
+    Args:
+        c: SQLite cursor object.
+    """
+    c.execute("SELECT id, habit_id, completion_date FROM completions ORDER BY id")
+    seen = set()
+    duplicates = []
+    updates = []
+    for id, habit_id, completion_date in c.fetchall():
+        date = Habit.normalize_date(completion_date) or completion_date
+        if (habit_id, date) in seen:
+            duplicates.append((id,))
+        else:
+            seen.add((habit_id, date))
+            if date != completion_date:
+                updates.append((date, id))
+
+    # Duplicates must go first, otherwise an update can collide with the unique index.
+    c.executemany("DELETE FROM completions WHERE id = ?", duplicates)
+    c.executemany("UPDATE completions SET completion_date = ? WHERE id = ?", updates)
+
+
 def create_sample_habits():
     """
     Creates a list of sample habits.
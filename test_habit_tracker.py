@@ -1,6 +1,9 @@
 import unittest
-from habit_tracker import create_habit, update_habit, delete_habit, complete_task, get_habits, get_habit_by_id
+from habit_tracker import create_connection, create_habit, update_habit, delete_habit, complete_task, get_habits, \
+    get_habit_by_id
+from initialize_db import create_tables
 from analytics import longest_streak, get_habits_by_periodicity
+from habit import Habit
 from datetime import datetime, timedelta
 
 
@@ -9,6 +12,15 @@ class TestHabitTracker(unittest.TestCase):
     Unit test class for the Habit Tracker application.
     """
 
+    @classmethod
+    def setUpClass(cls):
+        """
+        Make sure the database schema, including the unique completion index, is up to date.
+        """
+        conn = create_connection()
+        create_tables(conn)
+        conn.close()
+
     def setUp(self):
         """
         Set up initial data before each test case.
@@ -70,6 +82,41 @@ class TestHabitTracker(unittest.TestCase):
         streak = longest_streak(get_habit_by_id(self.habit1.id))
         self.assertEqual(streak, 5)
 
+    def test_complete_task_duplicate(self):
+        """
+        Test that completing a task twice on the same date is stored only once.
+        """
+        self.assertTrue(complete_task(self.habit1.id, "1999-12-31"))
+        self.assertFalse(complete_task(self.habit1.id, "1999-12-31"))
+        completed_habit = get_habit_by_id(self.habit1.id)
+        self.assertEqual(completed_habit.completion_dates.count("1999-12-31"), 1)
+
+    def test_completion_dates_sorted_unique(self):
+        """
+        Test that habit completion dates are kept sorted and deduplicated.
+        """
+        habit = Habit(None, periodicity="daily", completion_dates=["2023-01-03", "2023-01-01", "2023-01-03"])
+        self.assertTrue(habit.complete_task("2023-01-02"))
+        self.assertFalse(habit.complete_task("2023-01-01"))
+        self.assertFalse(habit.complete_task("not a date"))
+        self.assertEqual(habit.completion_dates, ["2023-01-01", "2023-01-02", "2023-01-03"])
+        self.assertEqual(longest_streak(habit), 3)
+        habit.completion_dates.append("2023-01-03")
+        self.assertEqual(longest_streak(habit), 3)
+
+    def test_completion_queries(self):
+        """
+        Test the completed-on, next completion and previous completion queries.
+        """
+        habit = Habit(None, periodicity="daily", completion_dates=["2023-01-01", "2023-01-05"])
+        self.assertTrue(habit.is_completed_on("2023-01-05"))
+        self.assertFalse(habit.is_completed_on("2023-01-03"))
+        self.assertEqual(habit.next_completion("2023-01-01"), "2023-01-05")
+        self.assertEqual(habit.next_completion("2023-01-03"), "2023-01-05")
+        self.assertIsNone(habit.next_completion("2023-01-05"))
+        self.assertEqual(habit.previous_completion("2023-01-05"), "2023-01-01")
+        self.assertIsNone(habit.previous_completion("2023-01-01"))
+
     def test_get_habits_by_periodicity(self):
         """
         Test the functionality of getting habits by their periodicity.